@@ -7,149 +7,51 @@
 // the following is needed for WriteGraph()
 #include "llvm/Analysis/CFGPrinter.h"
 
-/* An iterator around a attribute list, including the stop condition */
-struct AttributeListIterator {
-    typedef llvm::AttributeList::iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    AttributeListIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueAttributeListIterator;
-typedef OpaqueAttributeListIterator *LLVMAttributeListIteratorRef;
-
-/* An iterator around a attribute set, including the stop condition */
-struct AttributeSetIterator {
-    typedef llvm::AttributeSet::iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    AttributeSetIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueAttributeSetIterator;
-typedef OpaqueAttributeSetIterator *LLVMAttributeSetIteratorRef;
-
-/* An iterator around a function's blocks, including the stop condition */
-struct BlocksIterator {
-    typedef llvm::Function::const_iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    BlocksIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueBlocksIterator;
-typedef OpaqueBlocksIterator *LLVMBlocksIteratorRef;
-
-/* An iterator around a function's arguments, including the stop condition */
-struct ArgumentsIterator {
-    typedef llvm::Function::const_arg_iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    ArgumentsIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueArgumentsIterator;
-typedef OpaqueArgumentsIterator *LLVMArgumentsIteratorRef;
-
-/* An iterator around a basic block's instructions, including the stop condition
- */
-struct InstructionsIterator {
-    typedef llvm::BasicBlock::const_iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    InstructionsIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueInstructionsIterator;
-typedef OpaqueInstructionsIterator *LLVMInstructionsIteratorRef;
-
-/* An iterator around a instruction's operands, including the stop condition */
-struct OperandsIterator {
-    typedef llvm::Instruction::const_op_iterator const_iterator;
-    const_iterator cur;
-    const_iterator end;
-
-    OperandsIterator(const_iterator cur, const_iterator end)
-        : cur(cur), end(end) {}
-};
-
-struct OpaqueOperandsIterator;
-typedef OpaqueOperandsIterator *LLVMOperandsIteratorRef;
-
-namespace llvm {
-
-static LLVMAttributeListIteratorRef wrap(AttributeListIterator *GI) {
-    return reinterpret_cast<LLVMAttributeListIteratorRef>(GI);
-}
-
-static AttributeListIterator *unwrap(LLVMAttributeListIteratorRef GI) {
-    return reinterpret_cast<AttributeListIterator *>(GI);
-}
-
-static LLVMAttributeSetIteratorRef wrap(AttributeSetIterator *GI) {
-    return reinterpret_cast<LLVMAttributeSetIteratorRef>(GI);
-}
-
-static AttributeSetIterator *unwrap(LLVMAttributeSetIteratorRef GI) {
-    return reinterpret_cast<AttributeSetIterator *>(GI);
-}
-
-static LLVMBlocksIteratorRef wrap(BlocksIterator *GI) {
-    return reinterpret_cast<LLVMBlocksIteratorRef>(GI);
-}
-
-static BlocksIterator *unwrap(LLVMBlocksIteratorRef GI) {
-    return reinterpret_cast<BlocksIterator *>(GI);
-}
-
-static LLVMArgumentsIteratorRef wrap(ArgumentsIterator *GI) {
-    return reinterpret_cast<LLVMArgumentsIteratorRef>(GI);
-}
-
-static ArgumentsIterator *unwrap(LLVMArgumentsIteratorRef GI) {
-    return reinterpret_cast<ArgumentsIterator *>(GI);
-}
-
-static LLVMInstructionsIteratorRef wrap(InstructionsIterator *GI) {
-    return reinterpret_cast<LLVMInstructionsIteratorRef>(GI);
-}
-
-static InstructionsIterator *unwrap(LLVMInstructionsIteratorRef GI) {
-    return reinterpret_cast<InstructionsIterator *>(GI);
-}
-
-static LLVMOperandsIteratorRef wrap(OperandsIterator *GI) {
-    return reinterpret_cast<LLVMOperandsIteratorRef>(GI);
+/* Write the textual form of each attribute in [begin, end) to a single
+   buffer, each one terminated by a NUL character.  The buffer must be freed
+   with LLVMPY_DisposeString(); it is NULL (and *len 0) if it couldn't be
+   allocated. */
+template <typename Iterator>
+static void attributesToString(Iterator begin, Iterator end, const char **out,
+                               size_t *len) {
+    std::string buf;
+    for (Iterator it = begin; it != end; ++it) {
+        buf += it->getAsString();
+        buf += '\0';
+    }
+    *out = LLVMPY_CreateByteString(buf.data(), buf.size());
+    *len = *out ? buf.size() : 0;
 }
 
-static OperandsIterator *unwrap(LLVMOperandsIteratorRef GI) {
-    return reinterpret_cast<OperandsIterator *>(GI);
+/* Store the values in [begin, end) to *out* as long as they fit in
+   *capacity* entries, and return the number of values either way.  The
+   range is only walked once, as e.g. a function's block count isn't cached
+   by LLVM. */
+template <typename Iterator>
+static size_t valuesToArray(Iterator begin, Iterator end, LLVMValueRef *out,
+                            size_t capacity) {
+    using namespace llvm;
+    size_t count = 0;
+    for (Iterator it = begin; it != end; ++it, ++count) {
+        if (count < capacity) {
+            out[count] = wrap(static_cast<const Value *>(&*it));
+        }
+    }
+    return count;
 }
 
-} // namespace llvm
-
 extern "C" {
 
-API_EXPORT(LLVMAttributeListIteratorRef)
-LLVMPY_FunctionAttributesIter(LLVMValueRef F) {
+API_EXPORT(void)
+LLVMPY_FunctionAttributes(LLVMValueRef F, const char **out, size_t *len) {
     using namespace llvm;
     Function *func = unwrap<Function>(F);
     AttributeList attrs = func->getAttributes();
-    return wrap(new AttributeListIterator(attrs.begin(), attrs.end()));
+    attributesToString(attrs.begin(), attrs.end(), out, len);
 }
 
-API_EXPORT(LLVMAttributeSetIteratorRef)
-LLVMPY_ArgumentAttributesIter(LLVMValueRef A) {
+API_EXPORT(void)
+LLVMPY_ArgumentAttributes(LLVMValueRef A, const char **out, size_t *len) {
     using namespace llvm;
     Argument *arg = unwrap<Argument>(A);
     unsigned argno = arg->getArgNo();
@@ -160,153 +62,75 @@ LLVMPY_ArgumentAttributesIter(LLVMValueRef A) {
                                getParamAttrs(argno)
 #endif
         ;
-    return wrap(new AttributeSetIterator(attrs.begin(), attrs.end()));
+    attributesToString(attrs.begin(), attrs.end(), out, len);
 }
 
-API_EXPORT(LLVMAttributeListIteratorRef)
-LLVMPY_CallInstAttributesIter(LLVMValueRef C) {
+API_EXPORT(void)
+LLVMPY_CallInstAttributes(LLVMValueRef C, const char **out, size_t *len) {
     using namespace llvm;
     CallInst *inst = unwrap<CallInst>(C);
     AttributeList attrs = inst->getAttributes();
-    return wrap(new AttributeListIterator(attrs.begin(), attrs.end()));
+    attributesToString(attrs.begin(), attrs.end(), out, len);
 }
 
-API_EXPORT(LLVMAttributeListIteratorRef)
-LLVMPY_InvokeInstAttributesIter(LLVMValueRef C) {
+API_EXPORT(void)
+LLVMPY_InvokeInstAttributes(LLVMValueRef C, const char **out, size_t *len) {
     using namespace llvm;
     InvokeInst *inst = unwrap<InvokeInst>(C);
     AttributeList attrs = inst->getAttributes();
-    return wrap(new AttributeListIterator(attrs.begin(), attrs.end()));
+    attributesToString(attrs.begin(), attrs.end(), out, len);
 }
 
-API_EXPORT(LLVMAttributeSetIteratorRef)
-LLVMPY_GlobalAttributesIter(LLVMValueRef G) {
+API_EXPORT(void)
+LLVMPY_GlobalAttributes(LLVMValueRef G, const char **out, size_t *len) {
     using namespace llvm;
     GlobalVariable *g = unwrap<GlobalVariable>(G);
     AttributeSet attrs = g->getAttributes();
-    return wrap(new AttributeSetIterator(attrs.begin(), attrs.end()));
+    attributesToString(attrs.begin(), attrs.end(), out, len);
 }
 
-API_EXPORT(LLVMBlocksIteratorRef)
-LLVMPY_FunctionBlocksIter(LLVMValueRef F) {
+/* The following functions fill *out* with the function's blocks or
+   arguments, or the block's instructions, if they fit in *capacity* entries,
+   and return their number either way */
+
+API_EXPORT(size_t)
+LLVMPY_FunctionBlocksArray(LLVMValueRef F, LLVMValueRef *out,
+                           size_t capacity) {
     using namespace llvm;
     Function *func = unwrap<Function>(F);
-    return wrap(new BlocksIterator(func->begin(), func->end()));
+    return valuesToArray(func->begin(), func->end(), out, capacity);
 }
 
-API_EXPORT(LLVMArgumentsIteratorRef)
-LLVMPY_FunctionArgumentsIter(LLVMValueRef F) {
+API_EXPORT(size_t)
+LLVMPY_FunctionArgumentsArray(LLVMValueRef F, LLVMValueRef *out,
+                              size_t capacity) {
     using namespace llvm;
     Function *func = unwrap<Function>(F);
-    return wrap(new ArgumentsIterator(func->arg_begin(), func->arg_end()));
+    return valuesToArray(func->arg_begin(), func->arg_end(), out, capacity);
 }
 
-API_EXPORT(LLVMInstructionsIteratorRef)
-LLVMPY_BlockInstructionsIter(LLVMValueRef B) {
+API_EXPORT(size_t)
+LLVMPY_BlockInstructionsArray(LLVMValueRef B, LLVMValueRef *out,
+                              size_t capacity) {
     using namespace llvm;
     BasicBlock *block = unwrap<BasicBlock>(B);
-    return wrap(new InstructionsIterator(block->begin(), block->end()));
+    return valuesToArray(block->begin(), block->end(), out, capacity);
 }
 
-API_EXPORT(LLVMOperandsIteratorRef)
-LLVMPY_InstructionOperandsIter(LLVMValueRef I) {
+/* Fill *out* with the instruction's operands if they fit in *capacity*
+   entries, and return the number of operands either way */
+API_EXPORT(size_t)
+LLVMPY_InstructionOperandsArray(LLVMValueRef I, LLVMValueRef *out,
+                                size_t capacity) {
     using namespace llvm;
     Instruction *inst = unwrap<Instruction>(I);
-    return wrap(new OperandsIterator(inst->op_begin(), inst->op_end()));
-}
-
-API_EXPORT(const char *)
-LLVMPY_AttributeListIterNext(LLVMAttributeListIteratorRef GI) {
-    using namespace llvm;
-    AttributeListIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return LLVMPY_CreateString((&*iter->cur++)->getAsString().c_str());
-    } else {
-        return NULL;
-    }
-}
-
-API_EXPORT(const char *)
-LLVMPY_AttributeSetIterNext(LLVMAttributeSetIteratorRef GI) {
-    using namespace llvm;
-    AttributeSetIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return LLVMPY_CreateString((&*iter->cur++)->getAsString().c_str());
-    } else {
-        return NULL;
-    }
-}
-
-API_EXPORT(LLVMValueRef)
-LLVMPY_BlocksIterNext(LLVMBlocksIteratorRef GI) {
-    using namespace llvm;
-    BlocksIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return wrap(static_cast<const Value *>(&*iter->cur++));
-    } else {
-        return NULL;
-    }
-}
-
-API_EXPORT(LLVMValueRef)
-LLVMPY_ArgumentsIterNext(LLVMArgumentsIteratorRef GI) {
-    using namespace llvm;
-    ArgumentsIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return wrap(&*iter->cur++);
-    } else {
-        return NULL;
-    }
-}
-
-API_EXPORT(LLVMValueRef)
-LLVMPY_InstructionsIterNext(LLVMInstructionsIteratorRef GI) {
-    using namespace llvm;
-    InstructionsIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return wrap(&*iter->cur++);
-    } else {
-        return NULL;
-    }
-}
-
-API_EXPORT(LLVMValueRef)
-LLVMPY_OperandsIterNext(LLVMOperandsIteratorRef GI) {
-    using namespace llvm;
-    OperandsIterator *iter = unwrap(GI);
-    if (iter->cur != iter->end) {
-        return wrap((&*iter->cur++)->get());
-    } else {
-        return NULL;
+    size_t count = inst->getNumOperands();
+    if (count <= capacity) {
+        for (const Use &op : inst->operands()) {
+            *out++ = wrap(op.get());
+        }
     }
-}
-
-API_EXPORT(void)
-LLVMPY_DisposeAttributeListIter(LLVMAttributeListIteratorRef GI) {
-    delete llvm::unwrap(GI);
-}
-
-API_EXPORT(void)
-LLVMPY_DisposeAttributeSetIter(LLVMAttributeSetIteratorRef GI) {
-    delete llvm::unwrap(GI);
-}
-
-API_EXPORT(void)
-LLVMPY_DisposeBlocksIter(LLVMBlocksIteratorRef GI) { delete llvm::unwrap(GI); }
-
-API_EXPORT(void)
-LLVMPY_DisposeArgumentsIter(LLVMArgumentsIteratorRef GI) {
-    delete llvm::unwrap(GI);
-}
-
-API_EXPORT(void)
-LLVMPY_DisposeInstructionsIter(LLVMInstructionsIteratorRef GI) {
-    delete llvm::unwrap(GI);
-}
-
-API_EXPORT(void)
-LLVMPY_DisposeOperandsIter(LLVMOperandsIteratorRef GI) {
-    delete llvm::unwrap(GI);
+    return count;
 }
 
 API_EXPORT(void)
@@ -318,8 +142,8 @@ API_EXPORT(const char *)
 LLVMPY_GetValueName(LLVMValueRef Val) { return LLVMGetValueName(Val); }
 
 API_EXPORT(void)
-LLVMPY_SetValueName(LLVMValueRef Val, const char *Name) {
-    LLVMSetValueName(Val, Name);
+LLVMPY_SetValueName(LLVMValueRef Val, const char *Name, size_t NameLen) {
+    LLVMSetValueName2(Val, Name, NameLen);
 }
 
 API_EXPORT(LLVMModuleRef)
@@ -10,8 +10,16 @@ def _decode_string(b):
     return b.decode('utf-8')
 
 
+def _as_utf8_bytes(s):
+    if isinstance(s, bytes):
+        return s
+    return s.encode('utf-8')
+
+
 _encode_string.__doc__ = """Encode a string for use by LLVM."""
 _decode_string.__doc__ = """Decode a LLVM character (byte)string."""
+_as_utf8_bytes.__doc__ = """Encode a string for use by LLVM, passing
+already-encoded bytes through unchanged."""
 
 
 _shutting_down = [False]
@@ -24,14 +24,8 @@ LLVMTargetLibraryInfoRef = _make_opaque_ref("LLVMTargetLibraryInfo")
 LLVMTargetRef = _make_opaque_ref("LLVMTarget")
 LLVMTargetMachineRef = _make_opaque_ref("LLVMTargetMachine")
 LLVMMemoryBufferRef = _make_opaque_ref("LLVMMemoryBuffer")
-LLVMAttributeListIterator = _make_opaque_ref("LLVMAttributeListIterator")
-LLVMAttributeSetIterator = _make_opaque_ref("LLVMAttributeSetIterator")
 LLVMGlobalsIterator = _make_opaque_ref("LLVMGlobalsIterator")
 LLVMFunctionsIterator = _make_opaque_ref("LLVMFunctionsIterator")
-LLVMBlocksIterator = _make_opaque_ref("LLVMBlocksIterator")
-LLVMArgumentsIterator = _make_opaque_ref("LLVMArgumentsIterator")
-LLVMInstructionsIterator = _make_opaque_ref("LLVMInstructionsIterator")
-LLVMOperandsIterator = _make_opaque_ref("LLVMOperandsIterator")
 LLVMTypesIterator = _make_opaque_ref("LLVMTypesIterator")
 LLVMObjectCacheRef = _make_opaque_ref("LLVMObjectCache")
 LLVMObjectFileRef = _make_opaque_ref("LLVMObjectFile")
@@ -65,6 +59,14 @@ class _LLVMLock:
         """
         self._cblist.remove((acq_fn, rel_fn))
 
+    @property
+    def guard(self):
+        """The context manager to hold the lock with: the lock itself if
+        callbacks are registered, otherwise the underlying RLock, whose
+        context manager is implemented in C and so is cheaper to enter.
+        """
+        return self if self._cblist else self._lock
+
     def __enter__(self):
         self._lock.acquire()
         # Invoke all callbacks
@@ -148,7 +150,7 @@ class _lib_fn_wrapper(object):
         self._cfn.restype = restype
 
     def __call__(self, *args, **kwargs):
-        with self._lock:
+        with self._lock.guard:
             return self._cfn(*args, **kwargs)
 
 
@@ -210,6 +212,9 @@ class _DeadPointer(object):
     """
 
 
+_dead_pointer = _DeadPointer()
+
+
 class OutputString(object):
     """
     Object for managing the char* output of LLVM APIs.
@@ -290,12 +295,14 @@ class ObjectRef(object):
     """
     A wrapper around a ctypes pointer to a LLVM object ("resource").
     """
-    _closed = False
-    _as_parameter_ = _DeadPointer()
+    # Slotted so that lightweight subclasses (e.g. ValueRef) can do without
+    # a per-instance __dict__; other subclasses still get one.
+    __slots__ = ('_ptr', '_as_parameter_', '_capi', '_closed', '__weakref__')
     # Whether this object pointer is owned by another one.
     _owned = False
 
     def __init__(self, ptr):
+        self._closed = False
         if ptr is None:
             raise ValueError("NULL pointer")
         self._ptr = ptr
@@ -317,7 +324,7 @@ class ObjectRef(object):
         Detach the underlying LLVM resource without disposing of it.
         """
         if not self._closed:
-            del self._as_parameter_
+            self._as_parameter_ = _dead_pointer
             self._closed = True
             self._ptr = None
 
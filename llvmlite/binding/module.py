@@ -3,8 +3,9 @@ from ctypes import (c_char_p, byref, POINTER, c_bool, create_string_buffer,
 
 from llvmlite.binding import ffi
 from llvmlite.binding.linker import link_modules
-from llvmlite.binding.common import _decode_string, _encode_string
-from llvmlite.binding.value import ValueRef, TypeRef
+from llvmlite.binding.common import (_decode_string, _encode_string,
+                                     _as_utf8_bytes)
+from llvmlite.binding.value import TypeRef, _make_value
 from llvmlite.binding.context import get_global_context
 
 
@@ -81,20 +82,20 @@ class ModuleRef(ffi.ObjectRef):
         Get a ValueRef pointing to the function named *name*.
         NameError is raised if the symbol isn't found.
         """
-        p = ffi.lib.LLVMPY_GetNamedFunction(self, _encode_string(name))
+        p = _LLVMPY_GetNamedFunction(self, _as_utf8_bytes(name))
         if not p:
             raise NameError(name)
-        return ValueRef(p, 'function', dict(module=self))
+        return _make_value(p, 'function', self)
 
     def get_global_variable(self, name):
         """
         Get a ValueRef pointing to the global variable named *name*.
         NameError is raised if the symbol isn't found.
         """
-        p = ffi.lib.LLVMPY_GetNamedGlobalVariable(self, _encode_string(name))
+        p = _LLVMPY_GetNamedGlobalVariable(self, _as_utf8_bytes(name))
         if not p:
             raise NameError(name)
-        return ValueRef(p, 'global', dict(module=self))
+        return _make_value(p, 'global', self)
 
     def get_struct_type(self, name):
         """
@@ -183,8 +184,8 @@ class ModuleRef(ffi.ObjectRef):
         (a function is a "global value" but not a "global variable" in
          LLVM parlance)
         """
-        it = ffi.lib.LLVMPY_ModuleGlobalsIter(self)
-        return _GlobalsIterator(it, dict(module=self))
+        it = _LLVMPY_ModuleGlobalsIter(self)
+        return _GlobalsIterator(it, self)
 
     @property
     def functions(self):
@@ -192,8 +193,8 @@ class ModuleRef(ffi.ObjectRef):
         Return an iterator over this module's functions.
         The iterator will yield a ValueRef for each function.
         """
-        it = ffi.lib.LLVMPY_ModuleFunctionsIter(self)
-        return _FunctionsIterator(it, dict(module=self))
+        it = _LLVMPY_ModuleFunctionsIter(self)
+        return _FunctionsIterator(it, self)
 
     @property
     def struct_types(self):
@@ -201,8 +202,8 @@ class ModuleRef(ffi.ObjectRef):
         Return an iterator over the struct types defined in
         the module. The iterator will yield a TypeRef.
         """
-        it = ffi.lib.LLVMPY_ModuleTypesIter(self)
-        return _TypesIterator(it, dict(module=self))
+        it = _LLVMPY_ModuleTypesIter(self)
+        return _TypesIterator(it, self)
 
     def clone(self):
         return ModuleRef(ffi.lib.LLVMPY_CloneModule(self), self._context)
@@ -212,15 +213,15 @@ class _Iterator(ffi.ObjectRef):
 
     kind = None
 
-    def __init__(self, ptr, parents):
+    def __init__(self, ptr, module):
         ffi.ObjectRef.__init__(self, ptr)
-        self._parents = parents
+        self._module = module
         assert self.kind is not None
 
     def __next__(self):
         vp = self._next()
         if vp:
-            return ValueRef(vp, self.kind, self._parents)
+            return _make_value(vp, self.kind, self._module)
         else:
             raise StopIteration
 
@@ -238,7 +239,7 @@ class _GlobalsIterator(_Iterator):
         self._capi.LLVMPY_DisposeGlobalsIter(self)
 
     def _next(self):
-        return ffi.lib.LLVMPY_GlobalsIterNext(self)
+        return _LLVMPY_GlobalsIterNext(self)
 
 
 class _FunctionsIterator(_Iterator):
@@ -249,7 +250,7 @@ class _FunctionsIterator(_Iterator):
         self._capi.LLVMPY_DisposeFunctionsIter(self)
 
     def _next(self):
-        return ffi.lib.LLVMPY_FunctionsIterNext(self)
+        return _LLVMPY_FunctionsIterNext(self)
 
 
 class _TypesIterator(_Iterator):
@@ -267,7 +268,7 @@ class _TypesIterator(_Iterator):
             raise StopIteration
 
     def _next(self):
-        return ffi.lib.LLVMPY_TypesIterNext(self)
+        return _LLVMPY_TypesIterNext(self)
 
     next = __next__
 
@@ -347,3 +348,16 @@ ffi.lib.LLVMPY_SetModuleName.argtypes = [ffi.LLVMModuleRef, c_char_p]
 
 ffi.lib.LLVMPY_GetModuleSourceFileName.argtypes = [ffi.LLVMModuleRef]
 ffi.lib.LLVMPY_GetModuleSourceFileName.restype = c_char_p
+
+
+# Bind the traversal entry points once, sparing the attribute lookup on
+# ``ffi.lib`` at every call.
+
+_LLVMPY_GetNamedFunction = ffi.lib.LLVMPY_GetNamedFunction
+_LLVMPY_GetNamedGlobalVariable = ffi.lib.LLVMPY_GetNamedGlobalVariable
+_LLVMPY_ModuleGlobalsIter = ffi.lib.LLVMPY_ModuleGlobalsIter
+_LLVMPY_ModuleFunctionsIter = ffi.lib.LLVMPY_ModuleFunctionsIter
+_LLVMPY_ModuleTypesIter = ffi.lib.LLVMPY_ModuleTypesIter
+_LLVMPY_GlobalsIterNext = ffi.lib.LLVMPY_GlobalsIterNext
+_LLVMPY_FunctionsIterNext = ffi.lib.LLVMPY_FunctionsIterNext
+_LLVMPY_TypesIterNext = ffi.lib.LLVMPY_TypesIterNext
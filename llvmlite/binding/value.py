@@ -1,8 +1,9 @@
-from ctypes import POINTER, c_char_p, c_int, c_size_t, c_uint, c_bool, c_void_p
+from ctypes import (POINTER, byref, c_char_p, c_int, c_size_t, c_uint, c_bool,
+                    c_void_p, string_at)
 import enum
 
 from llvmlite.binding import ffi
-from llvmlite.binding.common import _decode_string, _encode_string
+from llvmlite.binding.common import _decode_string, _as_utf8_bytes
 
 
 class Linkage(enum.IntEnum):
@@ -43,6 +44,18 @@ class StorageClass(enum.IntEnum):
     dllexport = 2
 
 
+# Map the raw values returned by the C-API to enum members; indexing these
+# is much cheaper than calling the enum classes.
+_linkages = {member.value: member for member in Linkage}
+_visibilities = {member.value: member for member in Visibility}
+_storage_classes = {member.value: member for member in StorageClass}
+
+
+# Enum attribute kinds by name, as looked up by add_function_attribute().
+# The mapping is fixed for a given LLVM build.
+_attribute_kinds = {}
+
+
 class TypeRef(ffi.ObjectRef):
     """A weak reference to a LLVM type
     """
@@ -51,14 +64,14 @@ class TypeRef(ffi.ObjectRef):
         """
         Get type name
         """
-        return ffi.ret_string(ffi.lib.LLVMPY_GetTypeName(self))
+        return ffi.ret_string(_LLVMPY_GetTypeName(self))
 
     @property
     def is_pointer(self):
         """
         Returns true is the type is a pointer type.
         """
-        return ffi.lib.LLVMPY_TypeIsPointer(self)
+        return _LLVMPY_TypeIsPointer(self)
 
     @property
     def element_type(self):
@@ -68,24 +81,55 @@ class TypeRef(ffi.ObjectRef):
         """
         if not self.is_pointer:
             raise ValueError("Type {} is not a pointer".format(self))
-        return TypeRef(ffi.lib.LLVMPY_GetElementType(self))
+        return TypeRef(_LLVMPY_GetElementType(self))
 
     def __str__(self):
-        return ffi.ret_string(ffi.lib.LLVMPY_PrintType(self))
+        return ffi.ret_string(_LLVMPY_PrintType(self))
 
 
 class ValueRef(ffi.ObjectRef):
     """A weak reference to a LLVM value.
     """
-
-    def __init__(self, ptr, kind, parents):
+    # Many ValueRefs are created while walking a module, so keep them small:
+    # the parent objects get a fixed slot each instead of a dict.
+    __slots__ = ('_kind', '_module', '_function', '_block', '_instruction',
+                 '_opcode')
+
+    # Overridden by the kind-specific subclasses below
+    is_global = False
+    is_function = False
+    is_block = False
+    is_argument = False
+    is_instruction = False
+    is_operand = False
+
+    def __init__(self, ptr, kind, module=None, function=None, block=None,
+                 instruction=None):
+        if type(module) is dict:
+            # Formerly, the parents were passed as a single dict
+            parents = module
+            module = parents.get('module')
+            function = parents.get('function')
+            block = parents.get('block')
+            instruction = parents.get('instruction')
+        if type(self) is ValueRef and kind in _value_classes:
+            # Switch to the subclass specialized for this kind of value, so
+            # that kind-specific members need not check the kind on each
+            # access.  Internally, _make_value() instantiates it directly.
+            self.__class__ = _value_classes[kind]
         self._kind = kind
-        self._parents = parents
+        # Keep parent objects (module, function, etc) alive
+        self._module = module
+        self._function = function
+        self._block = block
+        self._instruction = instruction
+        # Memoized read-only snapshots of immutable properties
+        self._opcode = None
         ffi.ObjectRef.__init__(self, ptr)
 
     def __str__(self):
         with ffi.OutputString() as outstr:
-            ffi.lib.LLVMPY_PrintValueToString(self, outstr)
+            _LLVMPY_PrintValueToString(self, outstr)
             return str(outstr)
 
     @property
@@ -93,107 +137,71 @@ class ValueRef(ffi.ObjectRef):
         """
         The module this function or global variable value was obtained from.
         """
-        return self._parents.get('module')
+        return self._module
 
     @property
     def function(self):
         """
         The function this argument or basic block value was obtained from.
         """
-        return self._parents.get('function')
+        return self._function
 
     @property
     def block(self):
         """
         The block this instruction value was obtained from.
         """
-        return self._parents.get('block')
+        return self._block
 
     @property
     def instruction(self):
         """
         The instruction this operand value was obtained from.
         """
-        return self._parents.get('instruction')
-
-    @property
-    def is_global(self):
-        return self._kind == 'global'
-
-    @property
-    def is_function(self):
-        return self._kind == 'function'
-
-    @property
-    def is_block(self):
-        return self._kind == 'block'
-
-    @property
-    def is_argument(self):
-        return self._kind == 'argument'
-
-    @property
-    def is_instruction(self):
-        return self._kind == 'instruction'
-
-    @property
-    def is_operand(self):
-        return self._kind == 'operand'
+        return self._instruction
 
     @property
     def name(self):
-        return _decode_string(ffi.lib.LLVMPY_GetValueName(self))
+        return _decode_string(_LLVMPY_GetValueName(self))
 
     @name.setter
     def name(self, val):
-        ffi.lib.LLVMPY_SetValueName(self, _encode_string(val))
+        name = _as_utf8_bytes(val)
+        _LLVMPY_SetValueName(self, name, len(name))
 
     @property
     def linkage(self):
-        return Linkage(ffi.lib.LLVMPY_GetLinkage(self))
+        return _linkages[_LLVMPY_GetLinkage(self)]
 
     @linkage.setter
     def linkage(self, value):
         if not isinstance(value, Linkage):
             value = Linkage[value]
-        ffi.lib.LLVMPY_SetLinkage(self, value)
+        _LLVMPY_SetLinkage(self, value)
 
     @property
     def visibility(self):
-        return Visibility(ffi.lib.LLVMPY_GetVisibility(self))
+        return _visibilities[_LLVMPY_GetVisibility(self)]
 
     @visibility.setter
     def visibility(self, value):
         if not isinstance(value, Visibility):
             value = Visibility[value]
-        ffi.lib.LLVMPY_SetVisibility(self, value)
+        _LLVMPY_SetVisibility(self, value)
 
     @property
     def storage_class(self):
-        return StorageClass(ffi.lib.LLVMPY_GetDLLStorageClass(self))
+        return _storage_classes[_LLVMPY_GetDLLStorageClass(self)]
 
     @storage_class.setter
     def storage_class(self, value):
         if not isinstance(value, StorageClass):
             value = StorageClass[value]
-        ffi.lib.LLVMPY_SetDLLStorageClass(self, value)
+        _LLVMPY_SetDLLStorageClass(self, value)
 
     def add_function_attribute(self, attr):
-        """Only works on function value
-
-        Parameters
-        -----------
-        attr : str
-            attribute name
-        """
-        if not self.is_function:
-            raise ValueError('expected function value, got %s' % (self._kind,))
-        attrname = str(attr)
-        attrval = ffi.lib.LLVMPY_GetEnumAttributeKindForName(
-            _encode_string(attrname), len(attrname))
-        if attrval == 0:
-            raise ValueError('no such attribute {!r}'.format(attrname))
-        ffi.lib.LLVMPY_AddFunctionAttr(self, attrval)
+        """Add an attribute to this function; only works on function value."""
+        raise ValueError('expected function value, got %s' % (self._kind,))
 
     @property
     def type(self):
@@ -201,7 +209,58 @@ class ValueRef(ffi.ObjectRef):
         This value's LLVM type.
         """
         # XXX what does this return?
-        return TypeRef(ffi.lib.LLVMPY_TypeOf(self))
+        return TypeRef(_LLVMPY_TypeOf(self))
+
+    @property
+    def is_declaration(self):
+        """Whether this global or function value is only declared here."""
+        raise ValueError('expected global or function value, got %s'
+                         % (self._kind,))
+
+    @property
+    def attributes(self):
+        """
+        Return an iterator over this value's attributes.
+        The iterator will yield a string for each attribute.
+        """
+        return iter(())
+
+    @property
+    def blocks(self):
+        """Return an iterator over this function's blocks."""
+        raise ValueError('expected function value, got %s' % (self._kind,))
+
+    @property
+    def arguments(self):
+        """Return an iterator over this function's arguments."""
+        raise ValueError('expected function value, got %s' % (self._kind,))
+
+    @property
+    def instructions(self):
+        """Return an iterator over this block's instructions."""
+        raise ValueError('expected block value, got %s' % (self._kind,))
+
+    @property
+    def operands(self):
+        """Return an iterator over this instruction's operands."""
+        raise ValueError('expected instruction value, got %s'
+                         % (self._kind,))
+
+    @property
+    def opcode(self):
+        """The instruction's opcode name."""
+        raise ValueError('expected instruction value, got %s'
+                         % (self._kind,))
+
+
+# The subclasses below only override the members that are valid for their
+# kind of value; the ValueRef versions raise ValueError.  ValueRef() picks
+# the right one, but _make_value() is cheaper.
+
+class _GlobalValueRef(ValueRef):
+
+    __slots__ = ()
+    is_global = True
 
     @property
     def is_declaration(self):
@@ -209,35 +268,43 @@ class ValueRef(ffi.ObjectRef):
         Whether this value (presumably global) is defined in the current
         module.
         """
-        if not (self.is_global or self.is_function):
-            raise ValueError('expected global or function value, got %s'
-                             % (self._kind,))
-        return ffi.lib.LLVMPY_IsDeclaration(self)
+        return _LLVMPY_IsDeclaration(self)
 
     @property
     def attributes(self):
+        return iter(_collect_attributes(_LLVMPY_GlobalAttributes, self))
+
+
+class _FunctionValueRef(ValueRef):
+
+    __slots__ = ()
+    is_function = True
+
+    def add_function_attribute(self, attr):
+        """Only works on function value
+
+        Parameters
+        -----------
+        attr : str or bytes
+            attribute name
         """
-        Return an iterator over this value's attributes.
-        The iterator will yield a string for each attribute.
-        """
-        itr = iter(())
-        if self.is_function:
-            it = ffi.lib.LLVMPY_FunctionAttributesIter(self)
-            itr = _AttributeListIterator(it)
-        elif self.is_instruction:
-            if self.opcode == 'call':
-                it = ffi.lib.LLVMPY_CallInstAttributesIter(self)
-                itr = _AttributeListIterator(it)
-            elif self.opcode == 'invoke':
-                it = ffi.lib.LLVMPY_InvokeInstAttributesIter(self)
-                itr = _AttributeListIterator(it)
-        elif self.is_global:
-            it = ffi.lib.LLVMPY_GlobalAttributesIter(self)
-            itr = _AttributeSetIterator(it)
-        elif self.is_argument:
-            it = ffi.lib.LLVMPY_ArgumentAttributesIter(self)
-            itr = _AttributeSetIterator(it)
-        return itr
+        if not isinstance(attr, bytes):
+            attr = str(attr)
+        attrval = _attribute_kinds.get(attr)
+        if attrval is None:
+            attrname = _as_utf8_bytes(attr)
+            attrval = _LLVMPY_GetEnumAttributeKindForName(attrname,
+                                                          len(attrname))
+            if attrval == 0:
+                raise ValueError('no such attribute {!r}'.format(attr))
+            _attribute_kinds[attr] = attrval
+        _LLVMPY_AddFunctionAttr(self, attrval)
+
+    is_declaration = _GlobalValueRef.is_declaration
+
+    @property
+    def attributes(self):
+        return iter(_collect_attributes(_LLVMPY_FunctionAttributes, self))
 
     @property
     def blocks(self):
@@ -245,12 +312,8 @@ class ValueRef(ffi.ObjectRef):
         Return an iterator over this function's blocks.
         The iterator will yield a ValueRef for each block.
         """
-        if not self.is_function:
-            raise ValueError('expected function value, got %s' % (self._kind,))
-        it = ffi.lib.LLVMPY_FunctionBlocksIter(self)
-        parents = self._parents.copy()
-        parents.update(function=self)
-        return _BlocksIterator(it, parents)
+        ptrs = _collect_values(_LLVMPY_FunctionBlocksArray, self)
+        return _BlocksIterator(ptrs, self._module, self)
 
     @property
     def arguments(self):
@@ -258,12 +321,14 @@ class ValueRef(ffi.ObjectRef):
         Return an iterator over this function's arguments.
         The iterator will yield a ValueRef for each argument.
         """
-        if not self.is_function:
-            raise ValueError('expected function value, got %s' % (self._kind,))
-        it = ffi.lib.LLVMPY_FunctionArgumentsIter(self)
-        parents = self._parents.copy()
-        parents.update(function=self)
-        return _ArgumentsIterator(it, parents)
+        ptrs = _collect_values(_LLVMPY_FunctionArgumentsArray, self)
+        return _ArgumentsIterator(ptrs, self._module, self)
+
+
+class _BlockValueRef(ValueRef):
+
+    __slots__ = ()
+    is_block = True
 
     @property
     def instructions(self):
@@ -271,12 +336,35 @@ class ValueRef(ffi.ObjectRef):
         Return an iterator over this block's instructions.
         The iterator will yield a ValueRef for each instruction.
         """
-        if not self.is_block:
-            raise ValueError('expected block value, got %s' % (self._kind,))
-        it = ffi.lib.LLVMPY_BlockInstructionsIter(self)
-        parents = self._parents.copy()
-        parents.update(block=self)
-        return _InstructionsIterator(it, parents)
+        ptrs = _collect_values(_LLVMPY_BlockInstructionsArray, self)
+        return _InstructionsIterator(ptrs, self._module, self._function,
+                                     self)
+
+
+class _ArgumentValueRef(ValueRef):
+
+    __slots__ = ()
+    is_argument = True
+
+    @property
+    def attributes(self):
+        return iter(_collect_attributes(_LLVMPY_ArgumentAttributes, self))
+
+
+class _InstructionValueRef(ValueRef):
+
+    __slots__ = ()
+    is_instruction = True
+
+    @property
+    def attributes(self):
+        opcode = self.opcode
+        if opcode == 'call':
+            return iter(_collect_attributes(_LLVMPY_CallInstAttributes, self))
+        elif opcode == 'invoke':
+            return iter(_collect_attributes(_LLVMPY_InvokeInstAttributes,
+                                            self))
+        return iter(())
 
     @property
     def operands(self):
@@ -284,124 +372,139 @@ class ValueRef(ffi.ObjectRef):
         Return an iterator over this instruction's operands.
         The iterator will yield a ValueRef for each operand.
         """
-        if not self.is_instruction:
-            raise ValueError('expected instruction value, got %s'
-                             % (self._kind,))
-        it = ffi.lib.LLVMPY_InstructionOperandsIter(self)
-        parents = self._parents.copy()
-        parents.update(instruction=self)
-        return _OperandsIterator(it, parents)
+        ptrs = _collect_values(_LLVMPY_InstructionOperandsArray, self)
+        return _OperandsIterator(ptrs, self._module, self._function,
+                                 self._block, self)
 
     @property
     def opcode(self):
-        if not self.is_instruction:
-            raise ValueError('expected instruction value, got %s'
-                             % (self._kind,))
-        return ffi.ret_string(ffi.lib.LLVMPY_GetOpcodeName(self))
+        """
+        The instruction's opcode name.  It is fetched once and then cached,
+        as an instruction's opcode cannot change.
+        """
+        if self._opcode is None:
+            self._opcode = ffi.ret_string(_LLVMPY_GetOpcodeName(self))
+        return self._opcode
 
 
-class _ValueIterator(ffi.ObjectRef):
+class _OperandValueRef(ValueRef):
 
-    kind = None  # derived classes must specify the Value kind value
-    # as class attribute
+    __slots__ = ()
+    is_operand = True
 
-    def __init__(self, ptr, parents):
-        ffi.ObjectRef.__init__(self, ptr)
-        # Keep parent objects (module, function, etc) alive
-        self._parents = parents
-        if self.kind is None:
-            raise NotImplementedError('%s must specify kind attribute'
-                                      % (type(self).__name__,))
 
-    def __next__(self):
-        vp = self._next()
-        if vp:
-            return ValueRef(vp, self.kind, self._parents)
-        else:
-            raise StopIteration
+_value_classes = {
+    'global': _GlobalValueRef,
+    'function': _FunctionValueRef,
+    'block': _BlockValueRef,
+    'argument': _ArgumentValueRef,
+    'instruction': _InstructionValueRef,
+    'operand': _OperandValueRef,
+}
 
-    next = __next__
 
-    def __iter__(self):
-        return self
+def _make_value(ptr, kind, module=None, function=None, block=None,
+                instruction=None):
+    """
+    Create a ValueRef specialized for values of the given *kind*.
+    """
+    cls = _value_classes.get(kind, ValueRef)
+    return cls(ptr, kind, module, function, block, instruction)
 
 
-class _AttributeIterator(ffi.ObjectRef):
+# Large enough for the arguments, operands, etc of most values
+_ValuesBuffer = ffi.LLVMValueRef * 8
 
-    def __next__(self):
-        vp = self._next()
-        if vp:
-            return vp
-        else:
-            raise StopIteration
 
-    next = __next__
+def _collect_values(array_fn, value):
+    """
+    Fetch all the LLVMValueRefs enumerated by *array_fn* at once, rather
+    than crossing the FFI boundary once per element.  This usually takes a
+    single FFI call: the buffer is only resized and refilled for values
+    with many elements.
+    """
+    ptrs = _ValuesBuffer()
+    count = array_fn(value, ptrs, len(ptrs))
+    if count > len(ptrs):
+        ptrs = (ffi.LLVMValueRef * count)()
+        count = min(array_fn(value, ptrs, count), count)
+    return ptrs[:count]
 
-    def __iter__(self):
-        return self
 
+def _collect_attributes(fn, value):
+    """
+    Fetch the textual form of all of *value*'s attributes at once, as a
+    list of bytes.
+    """
+    ptr = c_char_p(None)
+    size = c_size_t(-1)
+    fn(value, byref(ptr), byref(size))
+    if not ptr:
+        raise MemoryError
+    try:
+        # Each attribute is terminated by a NUL character.  As before, the
+        # enumeration stops at the first empty attribute set; the trailing
+        # terminator guarantees there is one.
+        attrs = string_at(ptr, size.value).split(b'\0')
+        return attrs[:attrs.index(b'')]
+    finally:
+        _LLVMPY_DisposeString(ptr)
+
+
+class _ValueIterator(object):
 
-class _AttributeListIterator(_AttributeIterator):
+    kind = None  # derived classes must specify the Value kind value
+    # as class attribute
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeAttributeListIter(self)
+    # One iterator is created per blocks/instructions/operands access, so
+    # spare each of them a __dict__; subclasses must declare empty slots.
+    __slots__ = ('_ptrs', '_parents')
 
-    def _next(self):
-        return ffi.ret_bytes(ffi.lib.LLVMPY_AttributeListIterNext(self))
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.kind is None:
+            raise NotImplementedError('%s must specify kind attribute'
+                                      % (cls.__name__,))
 
+        # Specialize __next__ with the kind bound as a local
+        def __next__(self, _kind=cls.kind, _cls=_value_classes[cls.kind]):
+            return _cls(next(self._ptrs), _kind, *self._parents)
 
-class _AttributeSetIterator(_AttributeIterator):
+        cls.__next__ = cls.next = __next__
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeAttributeSetIter(self)
+    def __init__(self, ptrs, module=None, function=None, block=None,
+                 instruction=None):
+        self._ptrs = iter(ptrs)
+        # Keep parent objects (module, function, etc) alive
+        self._parents = (module, function, block, instruction)
 
-    def _next(self):
-        return ffi.ret_bytes(ffi.lib.LLVMPY_AttributeSetIterNext(self))
+    def __iter__(self):
+        return self
 
 
 class _BlocksIterator(_ValueIterator):
 
+    __slots__ = ()
     kind = 'block'
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeBlocksIter(self)
-
-    def _next(self):
-        return ffi.lib.LLVMPY_BlocksIterNext(self)
-
 
 class _ArgumentsIterator(_ValueIterator):
 
+    __slots__ = ()
     kind = 'argument'
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeArgumentsIter(self)
-
-    def _next(self):
-        return ffi.lib.LLVMPY_ArgumentsIterNext(self)
-
 
 class _InstructionsIterator(_ValueIterator):
 
+    __slots__ = ()
     kind = 'instruction'
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeInstructionsIter(self)
-
-    def _next(self):
-        return ffi.lib.LLVMPY_InstructionsIterNext(self)
-
 
 class _OperandsIterator(_ValueIterator):
 
+    __slots__ = ()
     kind = 'operand'
 
-    def _dispose(self):
-        self._capi.LLVMPY_DisposeOperandsIter(self)
-
-    def _next(self):
-        return ffi.lib.LLVMPY_OperandsIterNext(self)
-
 
 # FFI
 
@@ -416,7 +519,7 @@ ffi.lib.LLVMPY_GetGlobalParent.restype = ffi.LLVMModuleRef
 ffi.lib.LLVMPY_GetValueName.argtypes = [ffi.LLVMValueRef]
 ffi.lib.LLVMPY_GetValueName.restype = c_char_p
 
-ffi.lib.LLVMPY_SetValueName.argtypes = [ffi.LLVMValueRef, c_char_p]
+ffi.lib.LLVMPY_SetValueName.argtypes = [ffi.LLVMValueRef, c_char_p, c_size_t]
 
 ffi.lib.LLVMPY_TypeOf.argtypes = [ffi.LLVMValueRef]
 ffi.lib.LLVMPY_TypeOf.restype = ffi.LLVMTypeRef
@@ -458,61 +561,78 @@ ffi.lib.LLVMPY_AddFunctionAttr.argtypes = [ffi.LLVMValueRef, c_uint]
 ffi.lib.LLVMPY_IsDeclaration.argtypes = [ffi.LLVMValueRef]
 ffi.lib.LLVMPY_IsDeclaration.restype = c_int
 
-ffi.lib.LLVMPY_FunctionAttributesIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_FunctionAttributesIter.restype = ffi.LLVMAttributeListIterator
-
-ffi.lib.LLVMPY_CallInstAttributesIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_CallInstAttributesIter.restype = ffi.LLVMAttributeListIterator
-
-ffi.lib.LLVMPY_InvokeInstAttributesIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_InvokeInstAttributesIter.restype = ffi.LLVMAttributeListIterator
-
-ffi.lib.LLVMPY_GlobalAttributesIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_GlobalAttributesIter.restype = ffi.LLVMAttributeSetIterator
-
-ffi.lib.LLVMPY_ArgumentAttributesIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_ArgumentAttributesIter.restype = ffi.LLVMAttributeSetIterator
-
-ffi.lib.LLVMPY_FunctionBlocksIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_FunctionBlocksIter.restype = ffi.LLVMBlocksIterator
+ffi.lib.LLVMPY_FunctionAttributes.argtypes = [ffi.LLVMValueRef,
+                                              POINTER(c_char_p),
+                                              POINTER(c_size_t)]
 
-ffi.lib.LLVMPY_FunctionArgumentsIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_FunctionArgumentsIter.restype = ffi.LLVMArgumentsIterator
+ffi.lib.LLVMPY_CallInstAttributes.argtypes = [ffi.LLVMValueRef,
+                                              POINTER(c_char_p),
+                                              POINTER(c_size_t)]
 
-ffi.lib.LLVMPY_BlockInstructionsIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_BlockInstructionsIter.restype = ffi.LLVMInstructionsIterator
+ffi.lib.LLVMPY_InvokeInstAttributes.argtypes = [ffi.LLVMValueRef,
+                                                POINTER(c_char_p),
+                                                POINTER(c_size_t)]
 
-ffi.lib.LLVMPY_InstructionOperandsIter.argtypes = [ffi.LLVMValueRef]
-ffi.lib.LLVMPY_InstructionOperandsIter.restype = ffi.LLVMOperandsIterator
+ffi.lib.LLVMPY_GlobalAttributes.argtypes = [ffi.LLVMValueRef,
+                                            POINTER(c_char_p),
+                                            POINTER(c_size_t)]
 
-ffi.lib.LLVMPY_DisposeAttributeListIter.argtypes = [
-    ffi.LLVMAttributeListIterator]
+ffi.lib.LLVMPY_ArgumentAttributes.argtypes = [ffi.LLVMValueRef,
+                                              POINTER(c_char_p),
+                                              POINTER(c_size_t)]
 
-ffi.lib.LLVMPY_DisposeAttributeSetIter.argtypes = [ffi.LLVMAttributeSetIterator]
+ffi.lib.LLVMPY_FunctionBlocksArray.argtypes = [ffi.LLVMValueRef,
+                                               POINTER(ffi.LLVMValueRef),
+                                               c_size_t]
+ffi.lib.LLVMPY_FunctionBlocksArray.restype = c_size_t
 
-ffi.lib.LLVMPY_DisposeBlocksIter.argtypes = [ffi.LLVMBlocksIterator]
+ffi.lib.LLVMPY_FunctionArgumentsArray.argtypes = [ffi.LLVMValueRef,
+                                                  POINTER(ffi.LLVMValueRef),
+                                                  c_size_t]
+ffi.lib.LLVMPY_FunctionArgumentsArray.restype = c_size_t
 
-ffi.lib.LLVMPY_DisposeInstructionsIter.argtypes = [ffi.LLVMInstructionsIterator]
+ffi.lib.LLVMPY_BlockInstructionsArray.argtypes = [ffi.LLVMValueRef,
+                                                  POINTER(ffi.LLVMValueRef),
+                                                  c_size_t]
+ffi.lib.LLVMPY_BlockInstructionsArray.restype = c_size_t
 
-ffi.lib.LLVMPY_DisposeOperandsIter.argtypes = [ffi.LLVMOperandsIterator]
-
-ffi.lib.LLVMPY_AttributeListIterNext.argtypes = [ffi.LLVMAttributeListIterator]
-ffi.lib.LLVMPY_AttributeListIterNext.restype = c_void_p
-
-ffi.lib.LLVMPY_AttributeSetIterNext.argtypes = [ffi.LLVMAttributeSetIterator]
-ffi.lib.LLVMPY_AttributeSetIterNext.restype = c_void_p
-
-ffi.lib.LLVMPY_BlocksIterNext.argtypes = [ffi.LLVMBlocksIterator]
-ffi.lib.LLVMPY_BlocksIterNext.restype = ffi.LLVMValueRef
-
-ffi.lib.LLVMPY_ArgumentsIterNext.argtypes = [ffi.LLVMArgumentsIterator]
-ffi.lib.LLVMPY_ArgumentsIterNext.restype = ffi.LLVMValueRef
-
-ffi.lib.LLVMPY_InstructionsIterNext.argtypes = [ffi.LLVMInstructionsIterator]
-ffi.lib.LLVMPY_InstructionsIterNext.restype = ffi.LLVMValueRef
-
-ffi.lib.LLVMPY_OperandsIterNext.argtypes = [ffi.LLVMOperandsIterator]
-ffi.lib.LLVMPY_OperandsIterNext.restype = ffi.LLVMValueRef
+ffi.lib.LLVMPY_InstructionOperandsArray.argtypes = [ffi.LLVMValueRef,
+                                                    POINTER(ffi.LLVMValueRef),
+                                                    c_size_t]
+ffi.lib.LLVMPY_InstructionOperandsArray.restype = c_size_t
 
 ffi.lib.LLVMPY_GetOpcodeName.argtypes = [ffi.LLVMValueRef]
 ffi.lib.LLVMPY_GetOpcodeName.restype = c_void_p
+
+
+# Bind the entry points used above once, sparing the attribute lookup on
+# ``ffi.lib`` at every call.
+
+_LLVMPY_PrintValueToString = ffi.lib.LLVMPY_PrintValueToString
+_LLVMPY_GetValueName = ffi.lib.LLVMPY_GetValueName
+_LLVMPY_SetValueName = ffi.lib.LLVMPY_SetValueName
+_LLVMPY_TypeOf = ffi.lib.LLVMPY_TypeOf
+_LLVMPY_PrintType = ffi.lib.LLVMPY_PrintType
+_LLVMPY_TypeIsPointer = ffi.lib.LLVMPY_TypeIsPointer
+_LLVMPY_GetElementType = ffi.lib.LLVMPY_GetElementType
+_LLVMPY_GetTypeName = ffi.lib.LLVMPY_GetTypeName
+_LLVMPY_GetLinkage = ffi.lib.LLVMPY_GetLinkage
+_LLVMPY_SetLinkage = ffi.lib.LLVMPY_SetLinkage
+_LLVMPY_GetVisibility = ffi.lib.LLVMPY_GetVisibility
+_LLVMPY_SetVisibility = ffi.lib.LLVMPY_SetVisibility
+_LLVMPY_GetDLLStorageClass = ffi.lib.LLVMPY_GetDLLStorageClass
+_LLVMPY_SetDLLStorageClass = ffi.lib.LLVMPY_SetDLLStorageClass
+_LLVMPY_GetEnumAttributeKindForName = ffi.lib.LLVMPY_GetEnumAttributeKindForName
+_LLVMPY_AddFunctionAttr = ffi.lib.LLVMPY_AddFunctionAttr
+_LLVMPY_IsDeclaration = ffi.lib.LLVMPY_IsDeclaration
+_LLVMPY_FunctionAttributes = ffi.lib.LLVMPY_FunctionAttributes
+_LLVMPY_CallInstAttributes = ffi.lib.LLVMPY_CallInstAttributes
+_LLVMPY_InvokeInstAttributes = ffi.lib.LLVMPY_InvokeInstAttributes
+_LLVMPY_GlobalAttributes = ffi.lib.LLVMPY_GlobalAttributes
+_LLVMPY_ArgumentAttributes = ffi.lib.LLVMPY_ArgumentAttributes
+_LLVMPY_FunctionBlocksArray = ffi.lib.LLVMPY_FunctionBlocksArray
+_LLVMPY_FunctionArgumentsArray = ffi.lib.LLVMPY_FunctionArgumentsArray
+_LLVMPY_BlockInstructionsArray = ffi.lib.LLVMPY_BlockInstructionsArray
+_LLVMPY_InstructionOperandsArray = ffi.lib.LLVMPY_InstructionOperandsArray
+_LLVMPY_GetOpcodeName = ffi.lib.LLVMPY_GetOpcodeName
+_LLVMPY_DisposeString = ffi.lib.LLVMPY_DisposeString
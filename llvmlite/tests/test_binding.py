@@ -342,6 +342,36 @@ declare i8* @a_arg0_return_func(i8* returned, i32*)
 """
 
 
+asm_call_attributes = r"""
+    ; ModuleID = '<string>'
+    target triple = "{triple}"
+
+    @glob = global i32 0
+
+    declare void @callee(i32)
+
+    define void @caller(i32 %.1) {{
+      call void @callee(i32 %.1) nounwind readonly
+      ret void
+    }}
+    """
+
+
+asm_many_operands = r"""
+    ; ModuleID = '<string>'
+    target triple = "{triple}"
+
+    declare void @callee(i32, i32, i32, i32, i32, i32, i32, i32, i32, i32)
+
+    define void @caller(i32 %.0, i32 %.1, i32 %.2, i32 %.3, i32 %.4,
+                        i32 %.5, i32 %.6, i32 %.7, i32 %.8, i32 %.9) {{
+      call void @callee(i32 %.0, i32 %.1, i32 %.2, i32 %.3, i32 %.4,
+                        i32 %.5, i32 %.6, i32 %.7, i32 %.8, i32 %.9)
+      ret void
+    }}
+    """
+
+
 # This produces the following output from objdump:
 #
 # $ objdump -D 632.elf
@@ -1100,6 +1130,9 @@ class TestValueRef(BaseTest):
         self.assertEqual(glob.name, "glob")
         glob.name = "foobar"
         self.assertEqual(glob.name, "foobar")
+        glob.name = b"baz"
+        self.assertEqual(glob.name, "baz")
+        self.assertEqual(mod.get_global_variable(b"baz"), glob)
 
     def test_linkage(self):
         mod = self.module()
@@ -1144,6 +1177,20 @@ class TestValueRef(BaseTest):
         with self.assertRaises(ValueError) as raises:
             fn.add_function_attribute("zext")
         self.assertEqual(str(raises.exception), "no such attribute 'zext'")
+        # Resolved attribute kinds are cached, unknown names are not
+        cache = llvm.value._attribute_kinds
+        fn.add_function_attribute("noinline")
+        self.assertIn("noinline", cache)
+        self.assertNotIn("zext", cache)
+        other = self.module().get_function("sum")
+        other.add_function_attribute("noinline")
+        self.assertIn("noinline", str(other))
+        with self.assertRaises(ValueError):
+            other.add_function_attribute("zext")
+        self.assertNotIn("zext", cache)
+        other.add_function_attribute(b"cold")
+        self.assertIn(b"cold", cache)
+        self.assertIn("cold", str(other))
 
     def test_module(self):
         mod = self.module()
@@ -1244,6 +1291,36 @@ class TestValueRef(BaseTest):
         block = blocks[0]
         self.assertTrue(block.is_block)
 
+    def test_function_blocks_order(self):
+        func = self.module(asm_inlineasm2).get_function('caller')
+        blocks = list(func.blocks)
+        self.assertEqual([b.name for b in blocks], ['entry', 'main'])
+        self.assertEqual([i.opcode for i in blocks[1].instructions],
+                         ['load', 'add', 'add', 'call', 'ret'])
+        declared = self.module(asm_sum_declare).get_function('sum')
+        self.assertEqual(list(declared.blocks), [])
+        self.assertEqual(len(list(declared.arguments)), 2)
+
+    def test_many_blocks_arguments_instructions(self):
+        # More values than fit in the initial buffer
+        mod = ir.Module()
+        fnty = ir.FunctionType(ir.IntType(32), [ir.IntType(32)] * 20)
+        fn = ir.Function(mod, fnty, name='f')
+        blocks = [fn.append_basic_block('b%d' % i) for i in range(20)]
+        for block, succ in zip(blocks, blocks[1:]):
+            ir.IRBuilder(block).branch(succ)
+        builder = ir.IRBuilder(blocks[-1])
+        total = fn.args[0]
+        for arg in fn.args[1:]:
+            total = builder.add(total, arg)
+        builder.ret(total)
+        func = llvm.parse_assembly(str(mod)).get_function('f')
+        self.assertEqual([b.name for b in func.blocks],
+                         ['b%d' % i for i in range(20)])
+        self.assertEqual(len(list(func.arguments)), 20)
+        insts = list(list(func.blocks)[-1].instructions)
+        self.assertEqual([i.opcode for i in insts], ['add'] * 19 + ['ret'])
+
     def test_block_instructions(self):
         func = self.module().get_function('sum')
         insts = list(list(func.blocks)[0].instructions)
@@ -1268,6 +1345,57 @@ class TestValueRef(BaseTest):
         self.assertEqual(operands[1].name, '.2')
         self.assertEqual(str(operands[1].type), 'i32')
 
+    def test_many_instruction_operands(self):
+        mod = self.module(asm_many_operands)
+        call = list(list(mod.get_function('caller').blocks)[0]
+                    .instructions)[0]
+        self.assertEqual(call.opcode, 'call')
+        operands = list(call.operands)
+        self.assertEqual(len(operands), 11)
+        self.assertEqual([op.name for op in operands],
+                         ['.%d' % i for i in range(10)] + ['callee'])
+
+    def test_parents(self):
+        mod = self.module()
+        func = mod.get_function('sum')
+        block = list(func.blocks)[0]
+        inst = list(block.instructions)[0]
+        operand = list(inst.operands)[0]
+        self.assertIs(operand.instruction, inst)
+        self.assertIs(operand.block, block)
+        self.assertIs(operand.function, func)
+        self.assertIs(operand.module, mod)
+        self.assertIsNone(inst.instruction)
+        self.assertIsNone(func.block)
+        # The parents may also be given as a dict
+        value = llvm.ValueRef(inst._ptr, 'instruction',
+                              dict(module=mod, function=func, block=block))
+        self.assertIs(value.module, mod)
+        self.assertIs(value.function, func)
+        self.assertIs(value.block, block)
+        self.assertIsNone(value.instruction)
+
+    def test_kind_specialization(self):
+        mod = self.module()
+        func = mod.get_function('sum')
+        block = list(func.blocks)[0]
+        inst = list(block.instructions)[0]
+        values = [func, block, inst, list(inst.operands)[0],
+                  list(func.arguments)[0], mod.get_global_variable('glob')]
+        kinds = ['function', 'block', 'instruction', 'operand', 'argument',
+                 'global']
+        for value, kind in zip(values, kinds):
+            self.assertIsInstance(value, llvm.ValueRef)
+            for other in kinds:
+                self.assertIs(getattr(value, 'is_' + other), other == kind)
+        # Values constructed through ValueRef get specialized too
+        value = llvm.ValueRef(inst._ptr, 'instruction', mod, func, block)
+        self.assertIs(type(value), type(inst))
+        self.assertEqual(value.opcode, inst.opcode)
+        value = llvm.ValueRef(func._ptr, 'function', dict(module=mod))
+        self.assertTrue(value.is_function)
+        self.assertEqual(len(list(value.blocks)), 1)
+
     def test_function_attributes(self):
         mod = self.module(asm_attributes)
         for func in mod.functions:
@@ -1280,6 +1408,14 @@ class TestValueRef(BaseTest):
                 self.assertEqual(list(args[0].attributes), [b'returned'])
                 self.assertEqual(list(args[1].attributes), [])
 
+    def test_instruction_attributes(self):
+        mod = self.module(asm_call_attributes)
+        call, ret = list(list(mod.get_function('caller').blocks)[0]
+                         .instructions)
+        self.assertEqual(list(call.attributes), [b'nounwind readonly'])
+        self.assertEqual(list(ret.attributes), [])
+        self.assertEqual(list(mod.get_global_variable('glob').attributes), [])
+
 
 class TestTarget(BaseTest):
 